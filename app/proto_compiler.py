@@ -0,0 +1,110 @@
+import glob
+import hashlib
+import json
+import os
+
+from app.writer import MANIFEST_DIR
+
+CACHE_FILE = "protoc-cache.json"
+CACHE_VERSION = 1
+
+
+def toolchain_version():
+    """ เวอร์ชันของ grpcio-tools (None = ยังไม่ได้ติดตั้ง) """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("grpcio-tools")
+    except PackageNotFoundError:
+        return None
+
+
+def output_paths(proto_path):
+    base = proto_path[:-len(".proto")]
+    return base + "_pb2.py", base + "_pb2_grpc.py"
+
+
+def proto_hash(path, toolchain):
+    with open(path, "rb") as f:
+        return hashlib.sha256(toolchain.encode() + b"\0" + f.read()).hexdigest()
+
+
+def load_cache(root):
+    try:
+        with open(os.path.join(root, MANIFEST_DIR, CACHE_FILE)) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("protos", {})
+
+
+def save_cache(root, protos):
+    cache_dir = os.path.join(root, MANIFEST_DIR)
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, CACHE_FILE)
+    with open(f"{path}.tmp", "w") as f:
+        json.dump({"version": CACHE_VERSION, "protos": protos}, f, indent=2, sort_keys=True)
+    os.replace(f"{path}.tmp", path)
+
+
+def _compile(root, relpath):
+    """ รัน protoc ใน process ปัจจุบัน (import path ของไฟล์ที่ได้จะอิงจาก root เช่น app.grpc.x_pb2) """
+    import grpc_tools
+    from grpc_tools import protoc
+
+    include = os.path.join(os.path.dirname(grpc_tools.__file__), "_proto")
+    return protoc.main([
+        "grpc_tools.protoc", f"-I{root}", f"-I{include}",
+        f"--python_out={root}", f"--grpc_python_out={root}", os.path.join(root, relpath),
+    ])
+
+
+def compile_protos(root, relpaths=None, max_workers=None):
+    """ compile .proto เป็น *_pb2.py และ *_pb2_grpc.py ด้วย grpc_tools.protoc
+
+    ข้ามไฟล์ที่ hash ของเนื้อหาไม่เปลี่ยนตั้งแต่ compile ครั้งก่อน (.nbgen/protoc-cache.json)
+    ถ้าต้อง compile หลายไฟล์จะแยกทำพร้อมกันหลาย process
+    คืนค่า dict รายการไฟล์ที่ compile, ใช้ cache และ compile ไม่สำเร็จ
+    """
+    toolchain = toolchain_version()
+    if toolchain is None:
+        raise ImportError("grpcio-tools is not installed")
+
+    if relpaths is None:
+        relpaths = sorted(
+            os.path.relpath(path, root).replace(os.sep, "/")
+            for path in glob.glob(os.path.join(root, "app", "grpc", "*.proto"))
+        )
+
+    cache = load_cache(root)
+    hashes = {relpath: proto_hash(os.path.join(root, relpath), toolchain) for relpath in relpaths}
+    cached = [
+        relpath for relpath in relpaths
+        if cache.get(relpath) == hashes[relpath]
+        and all(os.path.exists(os.path.join(root, path)) for path in output_paths(relpath))
+    ]
+    stale = [relpath for relpath in relpaths if relpath not in cached]
+
+    workers = min(len(stale), max_workers or os.cpu_count() or 1)
+    if workers > 1:
+        # import ตอนใช้จริง: app.feature import module นี้ทุกคำสั่ง และ multiprocessing ทำให้ startup ช้าลง
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_compile, [root] * len(stale), stale))
+    else:
+        results = [_compile(root, relpath) for relpath in stale]
+
+    compiled = [relpath for relpath, code in zip(stale, results) if code == 0]
+    failed = [relpath for relpath, code in zip(stale, results) if code != 0]
+
+    recorded = dict(cache)
+    for relpath in failed:
+        recorded.pop(relpath, None)
+    recorded.update({relpath: hashes[relpath] for relpath in compiled})
+    if recorded != cache:
+        save_cache(root, recorded)
+
+    return {"compiled": compiled, "cached": cached, "failed": failed}
@@ -0,0 +1,127 @@
+import hashlib
+import json
+import os
+
+CACHE_DIR = ".nbgen"
+CACHE_FILE = "schema-cache.json"
+CACHE_VERSION = 2
+
+# Query ที่ดึง fingerprint ของทุกตารางใน schema ด้วย round-trip เดียว
+# ค่าที่ได้จะเปลี่ยนเมื่อโครงสร้างตารางเปลี่ยน (ALTER/DROP/CREATE รวมถึง index และ foreign key)
+FINGERPRINT_QUERIES = {
+    "postgresql": """
+        SELECT c.relname, c.relfilenode::text || ':' || c.xmin::text
+            || ':' || COALESCE((SELECT string_agg(i.indexrelid::text, ',' ORDER BY i.indexrelid)
+                                FROM pg_index i WHERE i.indrelid = c.oid), '')
+            || ':' || COALESCE((SELECT string_agg(k.oid::text, ',' ORDER BY k.oid)
+                                FROM pg_constraint k WHERE k.conrelid = c.oid), '')
+            || ':' || COALESCE((SELECT string_agg(a.xmin::text, ',' ORDER BY a.attnum)
+                                FROM pg_attribute a WHERE a.attrelid = c.oid AND a.attnum > 0), '')
+        FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE c.relkind IN ('r', 'p') AND n.nspname = COALESCE(:schema, current_schema())
+    """,
+    "mysql": """
+        SELECT t.TABLE_NAME, CONCAT_WS(':', t.CREATE_TIME, t.UPDATE_TIME, (
+            SELECT GROUP_CONCAT(CONCAT(s.INDEX_NAME, '.', s.COLUMN_NAME) ORDER BY s.INDEX_NAME, s.SEQ_IN_INDEX)
+            FROM information_schema.STATISTICS s
+            WHERE s.TABLE_SCHEMA = t.TABLE_SCHEMA AND s.TABLE_NAME = t.TABLE_NAME
+        ))
+        FROM information_schema.TABLES t
+        WHERE t.TABLE_TYPE = 'BASE TABLE' AND t.TABLE_SCHEMA = COALESCE(:schema, DATABASE())
+    """,
+    "mssql": """
+        SELECT o.name, CONVERT(varchar(33), o.modify_date, 126) + ':' + ISNULL(CONVERT(varchar(33), (
+            SELECT MAX(x.modify_date) FROM sys.objects x WHERE x.parent_object_id = o.object_id
+        ), 126), '') + ':' + CAST((SELECT COUNT(*) FROM sys.indexes i WHERE i.object_id = o.object_id) AS varchar(10))
+        FROM sys.objects o
+        WHERE o.type = 'U' AND SCHEMA_NAME(o.schema_id) = COALESCE(:schema, SCHEMA_NAME())
+    """,
+    "oracle": """
+        SELECT LOWER(object_name), TO_CHAR(last_ddl_time, 'YYYY-MM-DD"T"HH24:MI:SS')
+        FROM all_objects
+        WHERE object_type = 'TABLE' AND owner = COALESCE(:schema, SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA'))
+    """,
+    "sqlite": """
+        SELECT t.name, t.sql || COALESCE((
+            SELECT group_concat(i.sql, ';') FROM sqlite_master i WHERE i.type = 'index' AND i.tbl_name = t.name
+        ), '')
+        FROM sqlite_master t
+        WHERE t.type = 'table' AND t.name NOT LIKE 'sqlite_%' AND :schema IS NULL
+    """,
+}
+FINGERPRINT_QUERIES["mariadb"] = FINGERPRINT_QUERIES["mysql"]
+
+
+def cache_key(database_url):
+    """ สร้าง key ของฐานข้อมูลจาก URL โดยไม่เก็บรหัสผ่านลงไฟล์ """
+    from sqlalchemy.engine import make_url
+
+    return make_url(database_url).render_as_string(hide_password=True)
+
+
+def fetch_fingerprints(connection, schema=None):
+    """ ดึง fingerprint ของทุกตาราง คืนค่า None ถ้า dialect ไม่รองรับ """
+    from sqlalchemy import text
+
+    query = FINGERPRINT_QUERIES.get(connection.dialect.name)
+    if query is None:
+        return None
+    rows = connection.execute(text(query), {"schema": schema}).fetchall()
+    return {
+        name: hashlib.sha256(str(value).encode()).hexdigest()[:16]
+        for name, value in rows
+    }
+
+
+class SchemaCache:
+    """ cache ผลการ reflect ตาราง เก็บไว้ที่ <project>/.nbgen/schema-cache.json """
+
+    def __init__(self, path, data=None):
+        self.path = path
+        self.data = data or {"version": CACHE_VERSION, "databases": {}}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, base_path):
+        path = os.path.join(base_path, CACHE_DIR, CACHE_FILE)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(path)
+        if data.get("version") != CACHE_VERSION:
+            return cls(path)
+        return cls(path, data)
+
+    def _tables(self, database_url, schema):
+        databases = self.data["databases"]
+        return databases.setdefault(cache_key(database_url), {}).setdefault(schema or "", {})
+
+    def table_names(self, database_url, schema=None):
+        return sorted(self._tables(database_url, schema))
+
+    def get(self, database_url, table_name, schema=None, fingerprint=None):
+        """ คืนค่าคอลัมน์จาก cache ถ้า fingerprint ตรงกัน (ไม่ตรวจ fingerprint ถ้าเป็น None) """
+        entry = self._tables(database_url, schema).get(table_name)
+        if entry is None:
+            return None
+        if fingerprint is not None and entry.get("fingerprint") != fingerprint:
+            return None
+        return entry["columns"]
+
+    def put(self, database_url, table_name, columns, schema=None, fingerprint=None):
+        self._tables(database_url, schema)[table_name] = {
+            "fingerprint": fingerprint,
+            "columns": columns,
+        }
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
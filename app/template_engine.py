@@ -0,0 +1,154 @@
+import hashlib
+import marshal
+import os
+import re
+import sys
+
+# เปลี่ยนค่านี้เมื่อรูปแบบโค้ดที่ compile ออกมาเปลี่ยน เพื่อไม่ให้ใช้ bytecode cache เก่า
+ENGINE_VERSION = "1"
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+TEMPLATE_SUFFIX = ".tmpl"
+
+TOKEN_RE = re.compile(r"{{(.*?)}}|{%(.*?)%}", re.S)
+# บรรทัดที่มีแค่ tag {% ... %} จะถูกตัดทิ้งทั้งบรรทัด (รวม newline)
+TAG_LINE_RE = re.compile(r"^[ \t]*({%[^\n]*?%})[ \t]*\n", re.M)
+
+
+class TemplateSyntaxError(ValueError):
+    pass
+
+
+def user_cache_dir():
+    """ โฟลเดอร์ cache ของผู้ใช้ (กำหนดเองได้ด้วย NB_CACHE_DIR) """
+    if os.getenv("NB_CACHE_DIR"):
+        return os.getenv("NB_CACHE_DIR")
+    if sys.platform == "win32":
+        base = os.getenv("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "nb-fast-gen", "templates")
+
+
+def compile_template(source, name="<template>"):
+    """ แปลง template เป็น code object ของ Python
+
+    รองรับ {{ expr }}, {% if %}/{% elif %}/{% else %}/{% endif %} และ {% for x in xs %}/{% endfor %}
+    """
+    source = TAG_LINE_RE.sub(r"\1", source)
+    lines = ["_out = []", "_w = _out.append"]
+    stack = []
+    pos = 0
+
+    def add(line):
+        lines.append("    " * len(stack) + line)
+
+    for match in TOKEN_RE.finditer(source):
+        if match.start() > pos:
+            add(f"_w({source[pos:match.start()]!r})")
+        pos = match.end()
+
+        expression, statement = match.group(1), match.group(2)
+        if expression is not None:
+            add(f"_w(str({expression.strip()}))")
+            continue
+
+        statement = statement.strip()
+        keyword = statement.split(None, 1)[0] if statement else ""
+        if keyword in ("if", "for"):
+            add(f"{statement}:")
+            stack.append(keyword)
+            add("pass")
+        elif keyword in ("elif", "else"):
+            if not stack or stack[-1] != "if":
+                raise TemplateSyntaxError(f"{name}: unexpected '{{% {statement} %}}'")
+            stack.pop()
+            add(f"{statement}:")
+            stack.append("if")
+            add("pass")
+        elif keyword in ("endif", "endfor"):
+            if not stack or stack[-1] != keyword[3:]:
+                raise TemplateSyntaxError(f"{name}: unexpected '{{% {statement} %}}'")
+            stack.pop()
+        else:
+            raise TemplateSyntaxError(f"{name}: unknown tag '{{% {statement} %}}'")
+
+    if stack:
+        raise TemplateSyntaxError(f"{name}: missing '{{% end{stack[-1]} %}}'")
+    if pos < len(source):
+        add(f"_w({source[pos:]!r})")
+    lines.append("_result = ''.join(_out)")
+
+    try:
+        return compile("\n".join(lines), f"<template {name}>", "exec")
+    except SyntaxError as e:
+        raise TemplateSyntaxError(f"{name}: {e.msg}") from e
+
+
+class TemplateRegistry:
+    """ โหลด template จากแพ็กเกจ compile ครั้งเดียวต่อ process และเก็บ bytecode ไว้ใน cache dir """
+
+    def __init__(self, template_dir=TEMPLATE_DIR, cache_dir=None):
+        self.template_dir = template_dir
+        self.cache_dir = cache_dir or user_cache_dir()
+        self._compiled = {}
+
+    def names(self):
+        names = []
+        for root, _, files in os.walk(self.template_dir):
+            for filename in files:
+                if filename.endswith(TEMPLATE_SUFFIX):
+                    path = os.path.relpath(os.path.join(root, filename), self.template_dir)
+                    names.append(path[:-len(TEMPLATE_SUFFIX)].replace(os.sep, "/"))
+        return sorted(names)
+
+    def source(self, name):
+        with open(os.path.join(self.template_dir, name + TEMPLATE_SUFFIX), encoding="utf-8") as f:
+            return f.read()
+
+    def _cache_path(self, source):
+        key = hashlib.sha256(f"{ENGINE_VERSION}\0{source}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.{sys.implementation.cache_tag}.bin")
+
+    def _load(self, name):
+        source = self.source(name)
+        cache_path = self._cache_path(source)
+        try:
+            with open(cache_path, "rb") as f:
+                return marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+        code = compile_template(source, name)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                marshal.dump(code, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # cache เป็นแค่ทางลัด เขียนไม่ได้ก็ยังทำงานต่อได้
+        return code
+
+    def get(self, name):
+        code = self._compiled.get(name)
+        if code is None:
+            code = self._compiled[name] = self._load(name)
+        return code
+
+    def precompile(self, names=None):
+        for name in names or self.names():
+            self.get(name)
+
+    def render(self, template_name, **context):
+        namespace = dict(context)
+        exec(self.get(template_name), namespace)
+        return namespace["_result"]
+
+
+registry = TemplateRegistry()
+
+
+def render(template_name, **context):
+    return registry.render(template_name, **context)
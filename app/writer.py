@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+FSYNC_POLICIES = ("none", "batch", "each")
+MAX_WORKERS = 16
+
+MANIFEST_DIR = ".nbgen"
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+class WritePlan:
+    """ รายการโฟลเดอร์และไฟล์ที่จะเขียน สร้างให้ครบก่อนแล้วค่อย emit ทีเดียว """
+
+    def __init__(self, root=None):
+        # root คือโฟลเดอร์ที่เก็บ .nbgen/manifest.json (None = ไม่ใช้ manifest)
+        self.root = root
+        self.dirs = set()
+        self.files = {}
+        self.merged = set()
+        self.started = time.perf_counter()
+
+    def add_dir(self, path):
+        self.dirs.add(os.path.normpath(path))
+
+    def add_file(self, path, content="", merged=False):
+        """ merged=True สำหรับไฟล์ที่อ่านเนื้อหาเดิมจากดิสก์มารวมแล้ว (เช่น router.py)
+        จึงเขียนทับได้แม้ผู้ใช้แก้ไขไฟล์ไว้ """
+        path = os.path.normpath(path)
+        self.add_dir(os.path.dirname(path) or ".")
+        self.files[path] = content
+        if merged:
+            self.merged.add(path)
+        else:
+            self.merged.discard(path)
+
+    def add_files(self, base_path, files, merged=False):
+        """ เพิ่มไฟล์จาก dict {relative_path: content} """
+        for file_path, content in files.items():
+            self.add_file(os.path.join(base_path, file_path), content, merged)
+
+    def add_structure(self, base_path, structure):
+        """ แปลงโครงสร้าง dict ซ้อนกันให้เป็นรายการโฟลเดอร์และไฟล์ """
+        for key, value in structure.items():
+            path = os.path.join(base_path, key)
+            if isinstance(value, dict):
+                self.add_dir(path)
+                self.add_structure(path, value)
+            else:
+                self.add_file(path, value)
+
+    def leaf_dirs(self):
+        """ โฟลเดอร์ที่ไม่ใช่ parent ของโฟลเดอร์อื่น (makedirs ตัวเดียวสร้าง parent ให้ครบ) """
+        dirs = sorted(self.dirs)
+        return [d for i, d in enumerate(dirs)
+                if not (i + 1 < len(dirs) and dirs[i + 1].startswith(d + os.sep))]
+
+
+def content_hash(content):
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def load_manifest(root):
+    """ อ่าน {relative_path: sha256} ของไฟล์ที่ generate ไว้ครั้งก่อน """
+    try:
+        with open(os.path.join(root, MANIFEST_DIR, MANIFEST_FILE)) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def save_manifest(root, files):
+    manifest_dir = os.path.join(root, MANIFEST_DIR)
+    os.makedirs(manifest_dir, exist_ok=True)
+    path = os.path.join(manifest_dir, MANIFEST_FILE)
+    with open(f"{path}.tmp", "w") as f:
+        json.dump({"version": MANIFEST_VERSION, "files": files}, f, indent=2, sort_keys=True)
+    os.replace(f"{path}.tmp", path)
+
+
+def _classify(path, new_hash, recorded_hash):
+    """ เทียบไฟล์บนดิสก์กับเนื้อหาใหม่: "new", "unchanged", "changed" หรือ "edited" """
+    try:
+        with open(path) as f:
+            disk_hash = content_hash(f.read())
+    except FileNotFoundError:
+        return "new"
+    except (OSError, UnicodeDecodeError):
+        return "edited"
+    if disk_hash == new_hash:
+        return "unchanged"
+    if disk_hash == recorded_hash:
+        return "changed"
+    return "edited"
+
+
+def _write(path, content, sync):
+    with open(path, "w") as f:
+        f.write(content)
+        if sync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def _fsync_path(path):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def emit(plan, fsync="none", force=False, max_workers=MAX_WORKERS):
+    """ เขียน WritePlan ลงดิสก์: สร้างโฟลเดอร์ทั้งหมดก่อน แล้วเขียนไฟล์ผ่าน thread pool
+
+    ไฟล์ที่เนื้อหาเหมือนเดิมจะไม่ถูกเขียนซ้ำ (mtime ไม่เปลี่ยน) และไฟล์ที่ผู้ใช้แก้ไขหลังจาก
+    generate ครั้งก่อน (hash ไม่ตรงกับ .nbgen/manifest.json) จะถูกข้าม เว้นแต่ force=True
+    fsync: "none" ไม่ sync, "batch" sync ทุกไฟล์และโฟลเดอร์ครั้งเดียวตอนท้าย,
+    "each" sync แต่ละไฟล์ทันทีหลังเขียน
+    คืนค่า dict ของเวลาแต่ละ phase (วินาที) และรายการไฟล์แยกตามผลลัพธ์
+    """
+    if fsync not in FSYNC_POLICIES:
+        raise ValueError(f"fsync must be one of {', '.join(FSYNC_POLICIES)}")
+
+    timings = {"plan": time.perf_counter() - plan.started}
+    all_paths = sorted(plan.files)
+    workers = max(1, min(max_workers, len(all_paths)))
+
+    start = time.perf_counter()
+    manifest = load_manifest(plan.root) if plan.root else {}
+    relpath = (lambda p: os.path.relpath(p, plan.root).replace(os.sep, "/")) if plan.root else (lambda p: p)
+    hashes = {path: content_hash(plan.files[path]) for path in all_paths}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        states = dict(zip(all_paths, pool.map(
+            lambda p: _classify(p, hashes[p], manifest.get(relpath(p))), all_paths
+        )))
+    skipped = [p for p in all_paths
+               if states[p] == "edited" and not force and p not in plan.merged]
+    unchanged = [p for p in all_paths if states[p] == "unchanged"]
+    paths = [p for p in all_paths if p not in set(skipped) and states[p] != "unchanged"]
+    timings["diff"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for directory in (plan.leaf_dirs() if paths else []):
+        os.makedirs(directory, exist_ok=True)
+    timings["mkdir"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # list() เพื่อให้ exception จาก thread ถูกส่งต่อขึ้นมา
+        list(pool.map(lambda p: _write(p, plan.files[p], fsync == "each"), paths))
+    timings["write"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if fsync == "batch" and paths:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_fsync_path, paths))
+        if os.name == "posix":
+            for directory in sorted(plan.dirs):
+                _fsync_path(directory)
+    timings["fsync"] = time.perf_counter() - start
+
+    if plan.root:
+        recorded = dict(manifest)
+        for path in paths + unchanged:
+            recorded[relpath(path)] = hashes[path]
+        if recorded != manifest:
+            save_manifest(plan.root, recorded)
+
+    return {
+        "written": paths,
+        "unchanged": unchanged,
+        "skipped": skipped,
+        "dirs": len(plan.dirs),
+        "timings": timings,
+    }
+
+
+def format_stats(stats):
+    phases = " | ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in stats["timings"].items())
+    lines = [f"⏱️ {len(stats['written'])} written, {len(stats['unchanged'])} unchanged — {phases}"]
+    if stats["skipped"]:
+        lines.append(f"⚠️ ข้าม {len(stats['skipped'])} ไฟล์ที่ถูกแก้ไขหลังจาก generate (ใช้ --force เพื่อเขียนทับ):")
+        lines.extend(f"   - {path}" for path in stats["skipped"])
+    return "\n".join(lines)
@@ -0,0 +1,136 @@
+"""Per-template compile/render cost and a many-resource generation benchmark.
+
+    python benchmarks/bench_templates.py [--resources 300] [--repeat 200]
+
+Template contexts are recorded from a real generator run (project, auth, docker,
+websocket, gen ms, add-graphql, add-grpc) against a temporary SQLite database,
+so they always match what FeatureManager passes to each template.
+"""
+import argparse
+import contextlib
+import io
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app.feature as feature  # noqa: E402
+from app.feature import FeatureManager  # noqa: E402
+from app.template_engine import TemplateRegistry, compile_template  # noqa: E402
+from app.writer import WritePlan  # noqa: E402
+
+TABLES = """
+create table customer (id integer primary key, email varchar(120) not null unique, name varchar(50));
+create table product (
+    id integer primary key,
+    customer_id integer references customer(id),
+    name varchar(255) not null,
+    price numeric(10, 2),
+    active boolean,
+    created_at datetime
+);
+"""
+
+
+@contextlib.contextmanager
+def recorded_renders(contexts):
+    """ เก็บ context แรกที่ FeatureManager ส่งให้แต่ละ template """
+    real_render = feature.render
+
+    def render(template, /, **context):
+        contexts.setdefault(template, context)
+        return real_render(template, **context)
+
+    feature.render = render
+    try:
+        yield
+    finally:
+        feature.render = real_render
+
+
+def generator_contexts(workdir):
+    """ รัน generator ลง WritePlan (ไม่เขียนไฟล์) แล้วคืน {template: context} กับคอลัมน์ที่ reflect ได้ """
+    database = os.path.join(workdir, "bench.db")
+    with sqlite3.connect(database) as connection:
+        connection.executescript(TABLES)
+    os.environ["DATABASE_URL"] = f"sqlite:///{database}"
+
+    contexts = {}
+    app_dir = os.path.join(workdir, "app")
+    with recorded_renders(contexts), contextlib.redirect_stdout(io.StringIO()):
+        plan = WritePlan(workdir)
+        FeatureManager.generate_env_file("sqlite", workdir, plan)
+        FeatureManager.generate_core_files(workdir, plan, serializer="msgspec")
+        FeatureManager.generate_api_files(workdir, plan)
+        FeatureManager.generate_project_files(workdir, plan)
+        FeatureManager.generate_main_file(workdir, plan)
+        FeatureManager.add_auth(workdir, plan)
+        FeatureManager.add_docker(workdir, plan, prod=True, db_memory="1g")
+        FeatureManager.add_websocket(workdir, plan, pubsub="memory")
+        tables = FeatureManager.reflect_tables(workdir, ["customer", "product"])
+        for table_name, columns in tables.items():
+            relationships = FeatureManager.relationships(table_name, columns, tables)
+            FeatureManager.write_model_and_schema(table_name, columns, app_dir, table_name, plan, relationships)
+            FeatureManager.generate_crud_and_router(
+                app_dir, table_name, plan, columns, relationships, export=True, cache=60,
+            )
+        FeatureManager.add_graphql(workdir, plan, table_names=list(tables))
+        FeatureManager.add_grpc(workdir, plan, aio=True, table_names=list(tables))
+    return contexts, tables["product"]
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resources", type=int, default=300, help="Number of gen ms resources to render.")
+    parser.add_argument("--repeat", type=int, default=200, help="Samples per template.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        contexts, columns = generator_contexts(workdir)
+        registry = TemplateRegistry(cache_dir=os.path.join(workdir, "cache"))
+        names = registry.names()
+
+        print(f"{'template':<28} {'compile [us]':>13} {'cached load [us]':>17} {'render [us]':>12}")
+        for name in names:
+            if name not in contexts:
+                print(f"{name:<28} {'(not rendered by the generator run)':>44}")
+                continue
+            source = registry.source(name)
+            compile_us = timed(lambda: compile_template(source, name), args.repeat) * 1e6
+            registry.get(name)
+
+            def cached_load():
+                registry._compiled.pop(name, None)
+                registry.get(name)
+
+            load_us = timed(cached_load, args.repeat) * 1e6
+            render_us = timed(lambda: registry.render(name, **contexts[name]), args.repeat) * 1e6
+            print(f"{name:<28} {compile_us:>13.1f} {load_us:>17.1f} {render_us:>12.1f}")
+
+        # gen ms ของหลายตาราง: model + schema + CRUD + router ผ่าน FeatureManager ลง plan เดียว (ไม่เขียนไฟล์)
+        plan = WritePlan(workdir)
+        output_dir = os.path.join(workdir, "app")
+        start = time.perf_counter()
+        for i in range(args.resources):
+            name = f"table{i}"
+            FeatureManager.write_model_and_schema("product", columns, output_dir, name, plan)
+            FeatureManager.generate_crud_and_router(output_dir, name, plan, columns)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"\n{args.resources} resources (model, schema, crud, router) generated in {elapsed_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
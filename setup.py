@@ -11,6 +11,7 @@ setup(
     url="https://github.com/TeryNobparat/cli-project-generator.git",
     packages=find_packages(),
     py_modules=["cli_project_generator"],
+    package_data={"app": ["templates/*/*.tmpl"]},
     install_requires=[
         "sqlalchemy",
         "pydantic",
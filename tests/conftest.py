@@ -0,0 +1,6 @@
+import os
+import sys
+
+# ให้ import app.* ได้เมื่อรัน pytest จากโฟลเดอร์ไหนก็ได้
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
@@ -0,0 +1,25 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("sqlalchemy", "pydantic", "dotenv", "requests", "multiprocessing")
+
+
+def test_cli_import_does_not_load_heavy_libraries():
+    code = (
+        "import sys, cli_project_generator, app.feature; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
+
+
+def test_profile_startup_reports_imports(tmp_path):
+    result = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "main.py"), "create", "proj", "--profile-startup"],
+        cwd=tmp_path, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "cli_project_generator" in result.stdout + result.stderr
+    assert (tmp_path / "proj" / "main.py").exists()
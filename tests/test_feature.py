@@ -0,0 +1,210 @@
+import asyncio
+
+import pytest
+
+from app.feature import FeatureManager, render
+
+
+def column(name, python_type="int", type_="INTEGER", **extra):
+    return {"name": name, "type": type_, "python_type": python_type, "nullable": True, **extra}
+
+
+ITEMS = [
+    column("order_id", primary_key=True),
+    column("line_no", primary_key=True),
+    column("sku", "str", "TEXT"),
+]
+ORDERS = [
+    column("id", primary_key=True),
+    column("customer_id", foreign_key={"table": "customer", "column": "id", "target": "customer.id"}),
+    column("email", "str", "VARCHAR(120)", foreign_key={"table": "customer", "column": "email", "target": "customer.email"}),
+    column("total", "str", "NUMERIC(10, 2)"),
+    column("created_at", "str", "DATETIME"),
+]
+CUSTOMER = [column("id", primary_key=True), column("email", "str", "VARCHAR(120)", unique=True)]
+LOGS = [column("at", "str", "TEXT"), column("message", "str", "TEXT")]
+
+
+def test_primary_key_columns_keep_table_order():
+    assert [c["name"] for c in FeatureManager.primary_key_columns(ITEMS)] == ["order_id", "line_no"]
+    assert [c["name"] for c in FeatureManager.primary_key_columns(ORDERS)] == ["id"]
+    assert FeatureManager.primary_key_columns(LOGS) == []
+
+
+def test_resource_context_for_single_key():
+    context = FeatureManager.resource_context("orders", ORDERS)
+
+    assert context["pk"]["name"] == "id"
+    assert context["composite"] is False
+    assert context["pk_order"] == "Orders.id"
+    assert context["cursor_type"] == "int"
+    assert context["use_async"] is False
+
+
+def test_resource_context_types_cursor_like_the_schema():
+    big = [column("id", "str", "BIGINT", primary_key=True), column("label", "str", "TEXT")]
+    context = FeatureManager.resource_context("big", big)
+
+    assert context["cursor_type"] == "int"
+    assert context["cursor_imports"] == []
+
+    dated = [column("day", "str", "DATE", primary_key=True), column("seq", primary_key=True)]
+    context = FeatureManager.resource_context("dated", dated)
+
+    assert context["cursor_type"] == "Tuple[date, int]"
+    assert context["cursor_imports"] == ["from datetime import date"]
+
+
+def test_bigint_primary_key_is_generated_by_the_database():
+    big = [column("id", "str", "BIGINT", primary_key=True), column("label", "str", "TEXT")]
+    namespace = {}
+    exec(FeatureManager.generate_schema("big", big, "big"), namespace)
+
+    assert "id" not in namespace["BigCreate"].model_fields
+    assert namespace["BigRead"].model_fields["id"].annotation is int
+
+
+def test_resource_context_for_composite_key():
+    context = FeatureManager.resource_context("items", ITEMS, use_async=True)
+
+    assert context["composite"] is True
+    assert context["pk_order"] == "Items.order_id, Items.line_no"
+    assert context["cursor_type"] == "Tuple[int, int]"
+    assert context["use_async"] is True
+
+
+def test_mappable_tables_skips_tables_without_primary_key(capsys):
+    tables = {"items": ITEMS, "orders": ORDERS, "logs": LOGS}
+
+    assert list(FeatureManager.mappable_tables(tables)) == ["items", "orders"]
+    assert list(FeatureManager.mappable_tables(tables, single_key=True)) == ["orders"]
+    output = capsys.readouterr().out
+    assert "'logs'" in output and "'items'" in output
+
+
+def test_unclaimed_tables_skips_tables_mapped_by_other_models(tmp_path, capsys):
+    (tmp_path / "models").mkdir()
+    (tmp_path / "models" / "user.py").write_text('class User(Base):\n    __tablename__ = "users"\n')
+    (tmp_path / "models" / "orders.py").write_text('class Orders(Base):\n    __tablename__ = "orders"\n')
+    tables = {"users": CUSTOMER, "orders": ORDERS}
+
+    assert list(FeatureManager.unclaimed_tables(str(tmp_path), tables)) == ["orders"]
+    assert "models/user.py" in capsys.readouterr().out
+    assert list(FeatureManager.unclaimed_tables(str(tmp_path), {"users": CUSTOMER}, name="user")) == ["users"]
+
+
+def test_update_router_file_moves_legacy_resource_routers(tmp_path, capsys):
+    routers = tmp_path / "api" / "routers"
+    routers.mkdir(parents=True)
+    (routers / "router.py").write_text(
+        "from fastapi import APIRouter\n"
+        "from app.api.routers import health, users\n"
+        "from app.api.routers import orders\n"
+        "\n"
+        "api_router = APIRouter()\n"
+        'api_router.include_router(users.router,prefix="/auth",tags=["auth"])\n'
+        'api_router.include_router(orders.router,prefix="/orders",tags=["orders"])\n'
+    )
+
+    FeatureManager.update_router_file(str(tmp_path), ["orders", "users"])
+    content = (routers / "router.py").read_text()
+
+    assert "from app.api.routers import orders\n" not in content
+    assert 'api_router.include_router(orders.router,' not in content
+    assert 'api_router.include_router(orders_router.router,prefix="/orders",tags=["orders"])' in content
+    assert 'api_router.include_router(users_router.router,prefix="/users",tags=["users"])' in content
+    assert 'api_router.include_router(users.router,prefix="/auth",tags=["auth"])' in content
+    assert "api/routers/orders_router.py" in capsys.readouterr().out
+
+
+def test_gen_ms_schema_is_set_on_models(tmp_path, monkeypatch):
+    reflected = []
+
+    def reflect_tables(output_dir, table_names=None, schema=None, refresh_cache=False, offline=False):
+        reflected.append(schema)
+        tables = {"orders": ORDERS[:1] + ORDERS[3:], "customer": CUSTOMER}
+        return {name: tables[name] for name in table_names or tables}
+
+    monkeypatch.setattr(FeatureManager, "reflect_tables", staticmethod(reflect_tables))
+    FeatureManager.generate_models_and_schemas_batch(str(tmp_path / "batch"), schema="sales")
+    FeatureManager.generate_models_and_schemas("customer", str(tmp_path / "single"), "client")
+
+    assert reflected == ["sales", None]
+    assert "    __table_args__ = {'schema': 'sales'}\n" in (tmp_path / "batch" / "models" / "orders.py").read_text()
+    assert "__table_args__" not in (tmp_path / "single" / "models" / "client.py").read_text()
+
+
+def test_proto_fields_convert_string_encoded_types():
+    fields, imports = FeatureManager.proto_fields(ORDERS)
+    by_name = {field["name"]: field for field in fields}
+
+    assert by_name["id"]["proto_type"] == "int64" and by_name["id"]["decode"] is None
+    assert by_name["total"]["proto_type"] == "string"
+    assert by_name["total"]["decode"] == 'Decimal(values["total"])'
+    assert by_name["created_at"]["encode"] == "row.created_at.isoformat()"
+    assert by_name["created_at"]["decode"] == 'datetime.fromisoformat(values["created_at"])'
+    assert imports == ["from datetime import datetime", "from decimal import Decimal"]
+
+
+def test_async_grpc_service_does_not_import_asyncio():
+    fields, imports = FeatureManager.proto_fields(ORDERS)
+    context = dict(table_name="orders", name="orders", class_name="Orders", columns=fields, pk=fields[0], imports=imports)
+
+    assert "import asyncio\n" in render("grpc/resource_service.py", aio=True, use_async=False, **context)
+    source = render("grpc/resource_service.py", aio=True, use_async=True, **context)
+    assert "asyncio" not in source
+    compile(source, "orders_service.py", "exec")
+
+
+class StalledWebSocket:
+    """ client ที่ไม่เคยอ่านข้อความ: send_text ค้างตลอด """
+
+    def __init__(self):
+        self.closed = False
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        await asyncio.Event().wait()
+
+    async def close(self):
+        self.closed = True
+
+
+def test_websocket_broadcast_does_not_wait_for_slow_clients():
+    pytest.importorskip("fastapi")
+    namespace = {}
+    exec(render("websocket/websocket.py", pubsub=None), namespace)
+
+    async def scenario():
+        manager = namespace["ConnectionManager"]()
+        stalled = StalledWebSocket()
+        client = await manager.connect(stalled)
+        for i in range(namespace["SEND_QUEUE_SIZE"] + 2):
+            await asyncio.wait_for(manager.broadcast(str(i)), 0.1)
+        await asyncio.sleep(0)
+        return manager, client, stalled
+
+    manager, client, stalled = asyncio.run(scenario())
+    assert client not in manager.clients
+    assert stalled.closed
+
+
+def test_graphql_fields_use_schema_types():
+    fields, imports = FeatureManager.graphql_fields(ORDERS + [column("payload", "str", "JSON")])
+    by_name = {field["name"]: field["graphql_type"] for field in fields}
+
+    assert by_name == {
+        "id": "int", "customer_id": "int", "email": "str", "total": "Decimal", "created_at": "datetime", "payload": "JSON",
+    }
+    assert imports == ["from datetime import datetime", "from decimal import Decimal", "from strawberry.scalars import JSON"]
+
+
+def test_graphql_relations_only_follow_primary_keys():
+    tables = {"orders": ORDERS, "customer": CUSTOMER}
+
+    relations = FeatureManager.graphql_relations("orders", "orders", ORDERS, tables)
+
+    assert [(rel["name"], rel["column"], rel["loader"]) for rel in relations] == [("customer", "customer_id", "customer")]
+    assert FeatureManager.graphql_relations("orders", "orders", ORDERS, {"orders": ORDERS}) == []
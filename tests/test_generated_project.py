@@ -0,0 +1,169 @@
+""" สร้างโปรเจคจริงด้วย CLI กับฐานข้อมูล SQLite ชั่วคราว แล้ว import และเรียก API ของโปรเจคนั้นใน process แยก
+
+(โปรเจคที่ generate มี package ชื่อ app เหมือนกับตัว generator จึงต้องรันแยก process)
+"""
+import os
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TABLES = """
+create table customer(id integer primary key, email varchar(120) not null unique, name varchar(50));
+create table orders(id integer primary key, customer_id integer references customer(id), total numeric(10, 2), created_at datetime);
+create table items(order_id integer not null, line_no integer not null, sku text, primary key(order_id, line_no));
+create table big(id bigint primary key, label text);
+create table logs(at text, message text);
+"""
+
+CHECK = """
+import json
+from fastapi.testclient import TestClient
+from main import app
+
+client = TestClient(app)
+assert client.get("/api/v1/health/db").status_code == 200
+
+seen, after = [], None
+while True:
+    params = {"limit": 2} if after is None else {"limit": 2, "after": json.dumps(after)}
+    page = client.get("/api/v1/items/items/", params=params).json()
+    seen += [(item["order_id"], item["line_no"]) for item in page["items"]]
+    if not page["has_more"]:
+        break
+    after = page["next_after"]
+assert seen == [(o, l) for o in (1, 2, 3) for l in (1, 2, 3)], seen
+assert client.get("/api/v1/items/items/", params={"after": "oops"}).status_code == 422
+
+page = client.get("/api/v1/orders/orders/", params={"limit": 1, "after": 1}).json()
+assert [row["id"] for row in page["items"]] == [2] and page["next_after"] == 2
+page = client.get("/api/v1/big/big/", params={"limit": 1, "after": 10}).json()
+assert [row["id"] for row in page["items"]] == [20] and page["next_after"] == 20
+print("ok")
+"""
+
+
+def run(args, cwd, env=None, stdin="n\\n"):
+    result = subprocess.run(
+        [sys.executable, *args], cwd=cwd, env={**os.environ, **(env or {})},
+        input=stdin, capture_output=True, text=True, timeout=300,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    return result.stdout
+
+
+def generate_project(tmp_path, flags, gen_flags=None):
+    """ create โปรเจค ใส่ข้อมูลตัวอย่างใน test.db แล้ว gen ms ทุกตาราง คืน (โฟลเดอร์โปรเจค, output ของ gen ms)
+
+    gen_flags: flag ของ gen ms (None = ใช้ flags เดียวกับ create)
+    """
+    run([os.path.join(ROOT, "main.py"), "create", "proj", *flags], cwd=tmp_path)
+    project = tmp_path / "proj"
+
+    with sqlite3.connect(project / "test.db") as connection:
+        connection.executescript(TABLES)
+        connection.executemany("insert into customer(email) values (?)", [("a@x",), ("b@x",)])
+        connection.executemany(
+            "insert into orders(customer_id, total, created_at) values (?, ?, ?)",
+            [(1, "1.50", "2026-01-02 03:04:05"), (2, "2.00", None), (1, "3.25", None)],
+        )
+        connection.executemany("insert into big values (?, ?)", [(10, "a"), (20, "b"), (30, "c")])
+        connection.executemany("insert into items values (?, ?, ?)", [(o, l, f"s{o}{l}") for o in (1, 2, 3) for l in (1, 2, 3)])
+
+    env = {"ROOT_PATH": str(project / "app"), "DATABASE_URL": "sqlite:///test.db"}
+    output = run([os.path.join(ROOT, "main.py"), "gen", "ms", "--all-tables", *(flags if gen_flags is None else gen_flags)], cwd=project, env=env)
+    return project, output
+
+
+@pytest.mark.parametrize("use_async, gen_flags", [(False, None), (True, None), (True, [])], ids=["sync", "async", "async-from-env"])
+def test_generated_project_imports_and_pages(tmp_path, use_async, gen_flags):
+    pytest.importorskip("fastapi.testclient")
+    if use_async:
+        pytest.importorskip("aiosqlite")
+    flags = ["--async"] if use_async else []
+    project, output = generate_project(tmp_path, flags, gen_flags)
+
+    assert "ข้ามตาราง 'logs'" in output
+    assert not (project / "app" / "models" / "logs.py").exists()
+    # gen ms ที่ไม่ใส่ --async ในโปรเจค async ต้องไม่เขียน CRUDBase ทับเป็นแบบ sync
+    assert ("AsyncSession" in (project / "app" / "crud" / "base.py").read_text()) is use_async
+
+    driver = "sqlite+aiosqlite" if use_async else "sqlite"
+    (project / "check_generated.py").write_text(CHECK)
+    assert run(["check_generated.py"], cwd=project, env={"DATABASE_URL": f"{driver}:///test.db"}).strip().endswith("ok")
+
+
+GRAPHQL_CHECK = """
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from app.api.routers.graphql import get_context, schema
+
+async def main():
+    query = "{ big(id: 20) { id label } orders(id: 1) { total createdAt customer { email } } }"
+    result = await schema.execute(query, context_value=await get_context())
+    assert result.errors is None, result.errors
+    assert result.data["big"] == {"id": 20, "label": "b"}, result.data
+    assert Decimal(result.data["orders"]["total"]) == Decimal("1.50"), result.data
+    assert datetime.fromisoformat(result.data["orders"]["createdAt"]) == datetime(2026, 1, 2, 3, 4, 5), result.data
+    assert result.data["orders"]["customer"] == {"email": "a@x"}, result.data
+    print("ok")
+
+asyncio.run(main())
+"""
+
+
+def test_graphql_types_match_column_types(tmp_path):
+    pytest.importorskip("strawberry")
+    project, _ = generate_project(tmp_path, [])
+    env = {"DATABASE_URL": "sqlite:///test.db"}
+    output = run([os.path.join(ROOT, "main.py"), "add-graphql", "--tables", "customer,orders,big", "--offline"], cwd=project, env=env)
+    assert "ไม่พบตาราง" not in output
+
+    (project / "check_graphql.py").write_text(GRAPHQL_CHECK)
+    assert run(["check_graphql.py"], cwd=project, env=env).strip().endswith("ok")
+
+
+AUTH_CHECK = """
+from fastapi.testclient import TestClient
+from main import app
+from app.models.user import User
+
+client = TestClient(app)
+assert client.get("/api/v1/health/db").status_code == 200
+assert client.get("/api/v1/sessions/sessions/").status_code == 200
+print("ok")
+"""
+
+
+def test_all_tables_skips_tables_mapped_by_auth(tmp_path):
+    pytest.importorskip("fastapi.testclient")
+    project, _ = generate_project(tmp_path, [])
+    with sqlite3.connect(project / "test.db") as connection:
+        connection.executescript("""
+            create table users(id integer primary key, username varchar(150) not null unique, hashed_password varchar(255) not null, is_active boolean not null);
+            create table sessions(id integer primary key, user_id integer references users(id));
+        """)
+
+    env = {"ROOT_PATH": str(project / "app"), "DATABASE_URL": "sqlite:///test.db"}
+    output = run([os.path.join(ROOT, "main.py"), "gen", "ms", "--all-tables"], cwd=project, env=env)
+
+    assert "map ไว้แล้วใน models/user.py" in output
+    assert not (project / "app" / "models" / "users.py").exists()
+    (project / "check_auth.py").write_text(AUTH_CHECK)
+    assert run(["check_auth.py"], cwd=project, env={"DATABASE_URL": "sqlite:///test.db"}).strip().endswith("ok")
+
+
+def test_add_grpc_offline_reuses_the_gen_ms_cache(tmp_path):
+    pytest.importorskip("grpc_tools")
+    project, _ = generate_project(tmp_path, [])
+
+    env = {"DATABASE_URL": "sqlite:///test.db"}
+    output = run([os.path.join(ROOT, "main.py"), "add-grpc", "--tables", "customer", "--offline"], cwd=project, env=env)
+
+    assert "ไม่พบตาราง" not in output
+    assert (project / "app" / "grpc" / "customer.proto").exists()
+    assert not (project / ".nbgen" / "schema-cache.json").exists()
@@ -0,0 +1,52 @@
+import pytest
+
+from app.proto_compiler import compile_protos
+
+pytest.importorskip("grpc_tools")
+
+PROTO = """syntax = "proto3";
+package {name};
+message {message} {{
+  int64 id = 1;
+}}
+"""
+
+
+def write_proto(root, name, message="Item"):
+    grpc_dir = root / "app" / "grpc"
+    grpc_dir.mkdir(parents=True, exist_ok=True)
+    (grpc_dir / f"{name}.proto").write_text(PROTO.format(name=name, message=message))
+
+
+def test_compiles_then_uses_cache(tmp_path):
+    write_proto(tmp_path, "item")
+
+    first = compile_protos(str(tmp_path))
+    assert first == {"compiled": ["app/grpc/item.proto"], "cached": [], "failed": []}
+    assert (tmp_path / "app" / "grpc" / "item_pb2.py").exists()
+    assert (tmp_path / "app" / "grpc" / "item_pb2_grpc.py").exists()
+
+    second = compile_protos(str(tmp_path))
+    assert second == {"compiled": [], "cached": ["app/grpc/item.proto"], "failed": []}
+
+
+def test_recompiles_changed_or_missing_outputs(tmp_path):
+    write_proto(tmp_path, "item")
+    write_proto(tmp_path, "order")
+    compile_protos(str(tmp_path), max_workers=1)
+
+    write_proto(tmp_path, "item", message="Renamed")
+    (tmp_path / "app" / "grpc" / "order_pb2.py").unlink()
+
+    result = compile_protos(str(tmp_path))
+    assert sorted(result["compiled"]) == ["app/grpc/item.proto", "app/grpc/order.proto"]
+    assert "Renamed" in (tmp_path / "app" / "grpc" / "item_pb2.py").read_text()
+
+
+def test_failed_proto_is_not_cached(tmp_path):
+    grpc_dir = tmp_path / "app" / "grpc"
+    grpc_dir.mkdir(parents=True)
+    (grpc_dir / "broken.proto").write_text("syntax = \"proto3\";\nmessage {\n")
+
+    assert compile_protos(str(tmp_path))["failed"] == ["app/grpc/broken.proto"]
+    assert compile_protos(str(tmp_path))["failed"] == ["app/grpc/broken.proto"]
@@ -0,0 +1,84 @@
+import os
+
+import pytest
+
+from app import template_engine
+from app.template_engine import TemplateRegistry, TemplateSyntaxError, compile_template
+
+
+def render_source(source, **context):
+    namespace = dict(context)
+    exec(compile_template(source), namespace)
+    return namespace["_result"]
+
+
+def test_expressions_blocks_and_tag_lines():
+    source = "{% for item in items %}\n{% if item > 1 %}\n- {{ item * 10 }}\n{% else %}\n- small\n{% endif %}\n{% endfor %}\n"
+
+    assert render_source(source, items=[1, 2, 3]) == "- small\n- 20\n- 30\n"
+
+
+def test_builtins_are_available():
+    assert render_source("{{ ', '.join(sorted(names)) }}", names={"b", "a"}) == "a, b"
+
+
+def test_undefined_variable_raises():
+    with pytest.raises(NameError):
+        render_source("{{ missing }}")
+
+
+@pytest.mark.parametrize("source", ["{% if x %}", "{% endif %}", "{% for x in y %}{% endif %}", "{% include x %}"])
+def test_unbalanced_or_unknown_tags(source):
+    with pytest.raises(TemplateSyntaxError):
+        compile_template(source)
+
+
+def make_registry(tmp_path, source):
+    template_dir = tmp_path / "templates"
+    (template_dir / "group").mkdir(parents=True)
+    (template_dir / "group" / "hello.py.tmpl").write_text(source)
+    return TemplateRegistry(template_dir=str(template_dir), cache_dir=str(tmp_path / "cache"))
+
+
+def test_registry_caches_bytecode_on_disk(tmp_path, monkeypatch):
+    registry = make_registry(tmp_path, "hello {{ name }}\n")
+
+    assert registry.names() == ["group/hello.py"]
+    assert registry.render("group/hello.py", name="world") == "hello world\n"
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+    # registry ใหม่ (เหมือน process ใหม่) โหลด bytecode จาก cache โดยไม่ compile ซ้ำ
+    def fail(*args, **kwargs):
+        raise AssertionError("template was recompiled")
+
+    monkeypatch.setattr(template_engine, "compile_template", fail)
+    fresh = TemplateRegistry(template_dir=registry.template_dir, cache_dir=registry.cache_dir)
+    assert fresh.render("group/hello.py", name="again") == "hello again\n"
+
+
+def test_registry_recompiles_when_source_changes(tmp_path):
+    registry = make_registry(tmp_path, "v1 {{ name }}\n")
+    registry.render("group/hello.py", name="x")
+
+    (tmp_path / "templates" / "group" / "hello.py.tmpl").write_text("v2 {{ name }}\n")
+    fresh = TemplateRegistry(template_dir=registry.template_dir, cache_dir=registry.cache_dir)
+
+    assert fresh.render("group/hello.py", name="x") == "v2 x\n"
+    assert len(os.listdir(tmp_path / "cache")) == 2
+
+
+def test_corrupt_cache_entry_is_ignored(tmp_path):
+    registry = make_registry(tmp_path, "ok {{ name }}\n")
+    registry.render("group/hello.py", name="x")
+    for filename in os.listdir(tmp_path / "cache"):
+        (tmp_path / "cache" / filename).write_bytes(b"not marshal data")
+
+    fresh = TemplateRegistry(template_dir=registry.template_dir, cache_dir=registry.cache_dir)
+
+    assert fresh.render("group/hello.py", name="x") == "ok x\n"
+
+
+def test_packaged_templates_compile():
+    registry = TemplateRegistry(cache_dir=None)
+    for name in registry.names():
+        compile_template(registry.source(name), name)
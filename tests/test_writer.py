@@ -0,0 +1,94 @@
+import json
+import os
+
+import pytest
+
+from app.writer import MANIFEST_DIR, MANIFEST_FILE, WritePlan, emit
+
+
+def plan_of(root, files, merged=False):
+    plan = WritePlan(str(root))
+    plan.add_files(str(root), files, merged=merged)
+    return plan
+
+
+def test_emit_creates_directories_and_files(tmp_path):
+    stats = emit(plan_of(tmp_path, {"a.py": "a = 1\n", "pkg/sub/b.py": "b = 2\n"}), fsync="batch")
+
+    assert len(stats["written"]) == 2
+    assert (tmp_path / "a.py").read_text() == "a = 1\n"
+    assert (tmp_path / "pkg" / "sub" / "b.py").read_text() == "b = 2\n"
+    assert set(stats["timings"]) == {"plan", "diff", "mkdir", "write", "fsync"}
+
+
+def test_leaf_dirs_skip_parents(tmp_path):
+    plan = plan_of(tmp_path, {"pkg/a.py": "", "pkg/sub/b.py": "", "other/c.py": ""})
+
+    assert plan.leaf_dirs() == sorted([str(tmp_path / "other"), str(tmp_path / "pkg" / "sub")])
+
+
+def test_unknown_fsync_policy_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        emit(plan_of(tmp_path, {"a.py": ""}), fsync="sometimes")
+
+
+def test_emit_writes_files_and_records_manifest(tmp_path):
+    stats = emit(plan_of(tmp_path, {"a.py": "a = 1\n", "pkg/b.py": "b = 2\n"}))
+
+    assert len(stats["written"]) == 2
+    assert (tmp_path / "pkg" / "b.py").read_text() == "b = 2\n"
+    manifest = json.loads((tmp_path / MANIFEST_DIR / MANIFEST_FILE).read_text())
+    assert sorted(manifest["files"]) == ["a.py", "pkg/b.py"]
+
+
+def test_unchanged_files_are_not_rewritten(tmp_path):
+    emit(plan_of(tmp_path, {"a.py": "a = 1\n"}))
+    path = tmp_path / "a.py"
+    os.utime(path, (0, 0))
+
+    stats = emit(plan_of(tmp_path, {"a.py": "a = 1\n"}))
+
+    assert stats["written"] == []
+    assert len(stats["unchanged"]) == 1
+    assert path.stat().st_mtime == 0
+
+
+def test_generated_files_are_updated(tmp_path):
+    emit(plan_of(tmp_path, {"a.py": "a = 1\n"}))
+
+    stats = emit(plan_of(tmp_path, {"a.py": "a = 2\n"}))
+
+    assert len(stats["written"]) == 1
+    assert (tmp_path / "a.py").read_text() == "a = 2\n"
+
+
+def test_user_edits_are_skipped_unless_forced(tmp_path):
+    emit(plan_of(tmp_path, {"a.py": "a = 1\n"}))
+    (tmp_path / "a.py").write_text("a = 'edited'\n")
+
+    stats = emit(plan_of(tmp_path, {"a.py": "a = 2\n"}))
+    assert len(stats["skipped"]) == 1
+    assert (tmp_path / "a.py").read_text() == "a = 'edited'\n"
+
+    stats = emit(plan_of(tmp_path, {"a.py": "a = 2\n"}), force=True)
+    assert len(stats["written"]) == 1
+    assert (tmp_path / "a.py").read_text() == "a = 2\n"
+
+
+def test_merged_files_overwrite_user_edits(tmp_path):
+    emit(plan_of(tmp_path, {"router.py": "routes = []\n"}))
+    (tmp_path / "router.py").write_text("routes = ['mine']\n")
+
+    stats = emit(plan_of(tmp_path, {"router.py": "routes = ['mine', 'new']\n"}, merged=True))
+
+    assert stats["skipped"] == []
+    assert (tmp_path / "router.py").read_text() == "routes = ['mine', 'new']\n"
+
+
+def test_existing_file_without_manifest_is_treated_as_edited(tmp_path):
+    (tmp_path / "a.py").write_text("handwritten\n")
+
+    stats = emit(plan_of(tmp_path, {"a.py": "generated\n"}))
+
+    assert len(stats["skipped"]) == 1
+    assert (tmp_path / "a.py").read_text() == "handwritten\n"